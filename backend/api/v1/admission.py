@@ -0,0 +1,19 @@
+from fastapi import APIRouter
+from services.admission import admission
+from models.schemas import AdmissionStatsResponse
+
+router = APIRouter()
+
+@router.get("/stats", response_model=AdmissionStatsResponse)
+async def get_admission_stats():
+    """
+    Report the state of the fast and slow computation lanes.
+
+    Returns per-lane queue depth, in-flight count, outcome counters, and latency percentiles.
+    """
+    return admission.stats()
+
+@router.get("/health")
+async def health_check():
+    """Health check endpoint for admission control."""
+    return {"status": "healthy", "service": "admission"}
\ No newline at end of file
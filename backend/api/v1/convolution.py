@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from services.math_engine import math_engine
+from services.admission import admission, AdmissionRejected, AdmissionTimeout
 from models.schemas import ConvolutionRequest, ConvolutionResponse
 
 router = APIRouter()
@@ -15,7 +16,10 @@ async def calculate_convolution(request: ConvolutionRequest):
     Returns the convolution result with numerical data for plotting.
     """
     try:
-        result = math_engine.calculate_convolution(request.signal_x, request.signal_h)
+        result = await admission.run(
+            'convolution', [request.signal_x, request.signal_h],
+            math_engine.calculate_convolution, request.signal_x, request.signal_h
+        )
 
         response = ConvolutionResponse(
             signal_x=result['signal_x'],
@@ -27,6 +31,10 @@ async def calculate_convolution(request: ConvolutionRequest):
 
         return response
 
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except AdmissionTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
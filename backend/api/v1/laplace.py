@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from services.math_engine import math_engine
+from services.admission import admission, AdmissionRejected, AdmissionTimeout
 from models.schemas import (
     LaplaceTransformRequest, LaplaceTransformResponse,
     InverseLaplaceRequest, InverseLaplaceResponse, InverseStep
@@ -17,7 +18,10 @@ async def calculate_laplace_transform(request: LaplaceTransformRequest):
     Returns the s-domain expression, region of convergence, poles, and zeros.
     """
     try:
-        result = math_engine.laplace_transform(request.expression_t)
+        result = await admission.run(
+            'laplace', [request.expression_t],
+            math_engine.laplace_transform, request.expression_t
+        )
 
         response = LaplaceTransformResponse(
             input_t=result['input_t'],
@@ -29,6 +33,10 @@ async def calculate_laplace_transform(request: LaplaceTransformRequest):
 
         return response
 
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except AdmissionTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -45,7 +53,10 @@ async def calculate_inverse_laplace_transform(request: InverseLaplaceRequest):
     Returns the time-domain expression and step-by-step solution.
     """
     try:
-        result = math_engine.inverse_laplace_transform(request.expression_s, request.is_causal)
+        result = await admission.run(
+            'inverse_laplace', [request.expression_s],
+            math_engine.inverse_laplace_transform, request.expression_s, request.is_causal
+        )
 
         # Convert steps to response model format
         steps = []
@@ -61,6 +72,10 @@ async def calculate_inverse_laplace_transform(request: InverseLaplaceRequest):
 
         return response
 
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except AdmissionTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
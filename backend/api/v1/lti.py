@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException
 from services.math_engine import math_engine
+from services.admission import admission, AdmissionRejected, AdmissionTimeout
 from models.schemas import LTIAnalysisRequest, LTIAnalysisResponse, FrequencyResponse, StepResponse
 
 router = APIRouter()
@@ -14,7 +15,10 @@ async def analyze_lti_system(request: LTIAnalysisRequest):
     Returns system analysis including poles, zeros, stability, and frequency response.
     """
     try:
-        result = math_engine.analyze_lti_system(request.transfer_function)
+        result = await admission.run(
+            'lti', [request.transfer_function],
+            math_engine.analyze_lti_system, request.transfer_function
+        )
 
         # Convert to response model format
         frequency_response = FrequencyResponse(
@@ -41,6 +45,10 @@ async def analyze_lti_system(request: LTIAnalysisRequest):
 
         return response
 
+    except AdmissionRejected as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except AdmissionTimeout as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
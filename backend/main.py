@@ -4,7 +4,8 @@ from fastapi.responses import JSONResponse
 import uvicorn
 
 # Import routers
-from api.v1 import properties, laplace, convolution, lti
+from api.v1 import properties, laplace, convolution, lti, admission
+from services.admission import admission as admission_controller
 
 app = FastAPI(
     title="Signal Companion API",
@@ -26,6 +27,12 @@ app.include_router(properties.router, prefix="/api/v1/properties", tags=["proper
 app.include_router(laplace.router, prefix="/api/v1/laplace", tags=["laplace"])
 app.include_router(convolution.router, prefix="/api/v1/convolution", tags=["convolution"])
 app.include_router(lti.router, prefix="/api/v1/lti", tags=["lti"])
+app.include_router(admission.router, prefix="/api/v1/admission", tags=["admission"])
+
+@app.on_event("startup")
+async def warm_up_admission():
+    # Start the slow lane's worker processes before the first request is timed
+    admission_controller.warm_up()
 
 @app.get("/")
 async def root():
@@ -80,4 +80,38 @@ class LTIAnalysisResponse(BaseModel):
 # Generic Error Response
 class ErrorResponse(BaseModel):
     error: str
-    detail: Optional[str] = None
\ No newline at end of file
+    detail: Optional[str] = None
+
+# Admission Control Models
+class LaneLatency(BaseModel):
+    samples: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+class LaneStats(BaseModel):
+    name: str
+    isolated: bool
+    max_concurrency: int
+    max_queue: Optional[int] = None
+    timeout_seconds: float
+    queue_timeout_seconds: Optional[float] = None
+    queue_depth: int
+    in_flight: int
+    abandoned: int
+    completed: int
+    failed: int
+    timed_out: int
+    rejected: int
+    expired: int
+    latency_ms: LaneLatency
+    wait_ms: LaneLatency
+    run_ms: LaneLatency
+
+class AdmissionStatsResponse(BaseModel):
+    slow_score: float
+    slow_seconds: float
+    tracked_shapes: int
+    lanes: List[LaneStats]
\ No newline at end of file
@@ -0,0 +1,433 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import sympy as sp
+
+from services.math_engine import math_engine
+
+
+class AdmissionRejected(Exception):
+    """Raised when a lane cannot start the request, either because its queue is full or the wait expired."""
+
+
+class AdmissionTimeout(Exception):
+    """Raised when a request runs longer than its lane's execution timeout."""
+
+    def __init__(self, message: str, elapsed: float):
+        super().__init__(message)
+        self.elapsed = elapsed
+
+
+def _run_in_process(conn, func: Callable[..., Any], args: Tuple[Any, ...]) -> None:
+    """Child-process entry point for isolated lanes; sends (ok, value) back to the parent."""
+    try:
+        outcome = (True, func(*args))
+    except Exception as e:
+        outcome = (False, e)
+    conn.send(outcome)
+    conn.close()
+
+
+def _warm_up_process() -> None:
+    """No-op child used to start an isolated lane's process machinery ahead of time."""
+
+
+class Lane:
+    def __init__(self, name: str, max_concurrency: int, timeout: float,
+                 max_queue: Optional[int] = None, queue_timeout: Optional[float] = None,
+                 isolated: bool = False, latency_window: int = 500):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.isolated = isolated
+
+        # Each lane has its own workers so slow jobs never occupy fast threads
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                            thread_name_prefix=f'admission-{name}')
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=latency_window)
+        self._waits = deque(maxlen=latency_window)
+        self._runs = deque(maxlen=latency_window)
+
+        # Isolated lanes run each job in a child process that is killed on overrun.
+        # A preloaded forkserver avoids forking the threaded server and re-importing SymPy.
+        self._context = None
+        if isolated:
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                self._context = multiprocessing.get_context('forkserver')
+                self._context.set_forkserver_preload(['services.math_engine'])
+            else:
+                self._context = multiprocessing.get_context('spawn')
+
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.rejected = 0
+        self.expired = 0
+        self.abandoned = 0
+
+    def warm_up(self) -> None:
+        """Start the forkserver (and its SymPy preload) so the first job is not charged for it."""
+        if not self.isolated:
+            return
+        process = self._context.Process(target=_warm_up_process, daemon=True)
+        process.start()
+        process.join()
+
+    def is_stalled(self) -> bool:
+        """Whether every worker is held by a job that already timed out."""
+        with self._lock:
+            return self.abandoned >= self.max_concurrency
+
+    def _run_isolated(self, func: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+        """Run func in a child process, killing it once the execution timeout passes."""
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(target=_run_in_process, args=(sender, func, args),
+                                        daemon=True)
+        started = time.perf_counter()
+        process.start()
+        sender.close()
+        try:
+            if not receiver.poll(self.timeout):
+                process.kill()
+                raise AdmissionTimeout(
+                    f"Computation exceeded the {self.name} lane timeout of {self.timeout:g}s",
+                    elapsed=time.perf_counter() - started
+                )
+            try:
+                ok, value = receiver.recv()
+            except EOFError:
+                raise RuntimeError(f"The {self.name} lane worker exited unexpectedly")
+        finally:
+            process.join()
+            receiver.close()
+
+        if not ok:
+            raise value
+        return value
+
+    async def submit(self, func: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+        """Run func in this lane and return (result, execution time in seconds)."""
+        with self._lock:
+            if self.max_queue is not None and self.queued >= self.max_queue:
+                self.rejected += 1
+                raise AdmissionRejected(f"The {self.name} lane is at capacity, try again later")
+            self.queued += 1
+
+        loop = asyncio.get_running_loop()
+        started = asyncio.Event()
+        state = {'started_at': None, 'finished': False, 'abandoned': False}
+
+        def job():
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+                state['started_at'] = time.perf_counter()
+            loop.call_soon_threadsafe(started.set)
+            try:
+                if self.isolated:
+                    return self._run_isolated(func, args), time.perf_counter() - state['started_at']
+                return func(*args), time.perf_counter() - state['started_at']
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    state['finished'] = True
+                    if state['abandoned']:
+                        self.abandoned -= 1
+
+        def on_done(future):
+            # A job cancelled before it started never decremented the queue
+            if future.cancelled():
+                with self._lock:
+                    self.queued -= 1
+
+        enqueued_at = time.perf_counter()
+        future = self._executor.submit(job)
+        future.add_done_callback(on_done)
+        wrapped = asyncio.wrap_future(future)
+        # An abandoned job may still fail later; retrieve it so asyncio does not log it
+        wrapped.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+        try:
+            # Waiting for a worker is bounded separately from running
+            waiter = asyncio.ensure_future(started.wait())
+            try:
+                await asyncio.wait({waiter, wrapped}, timeout=self.queue_timeout,
+                                   return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                waiter.cancel()
+
+            if not started.is_set() and future.cancel():
+                with self._lock:
+                    self.expired += 1
+                raise AdmissionRejected(
+                    f"The {self.name} lane did not start the request within "
+                    f"{self.queue_timeout:g}s, try again later"
+                )
+            await started.wait()
+
+            with self._lock:
+                self._waits.append(state['started_at'] - enqueued_at)
+
+            if self.isolated:
+                # The worker enforces the timeout itself by killing the child process
+                result, elapsed = await wrapped
+            else:
+                remaining = self.timeout - (time.perf_counter() - state['started_at'])
+                try:
+                    result, elapsed = await asyncio.wait_for(asyncio.shield(wrapped),
+                                                             max(remaining, 0))
+                except asyncio.TimeoutError:
+                    # A thread cannot be interrupted; it keeps its worker until it returns
+                    with self._lock:
+                        if not state['finished']:
+                            state['abandoned'] = True
+                            self.abandoned += 1
+                    raise AdmissionTimeout(
+                        f"Computation exceeded the {self.name} lane timeout of {self.timeout:g}s",
+                        elapsed=time.perf_counter() - state['started_at']
+                    )
+        except asyncio.CancelledError:
+            # The client went away; drop the job if it has not started yet
+            future.cancel()
+            raise
+        except AdmissionRejected:
+            raise
+        except AdmissionTimeout:
+            with self._lock:
+                self.timed_out += 1
+            raise
+        except Exception:
+            with self._lock:
+                self.failed += 1
+            raise
+        finally:
+            latency = time.perf_counter() - enqueued_at
+            with self._lock:
+                self._latencies.append(latency)
+
+        with self._lock:
+            self.completed += 1
+            self._runs.append(elapsed)
+        return result, elapsed
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of queue depth, counters, and wait, run, and total latency."""
+        with self._lock:
+            windows = {
+                'latency_ms': sorted(self._latencies),
+                'wait_ms': sorted(self._waits),
+                'run_ms': sorted(self._runs),
+            }
+            snapshot = {
+                'name': self.name,
+                'isolated': self.isolated,
+                'max_concurrency': self.max_concurrency,
+                'max_queue': self.max_queue,
+                'timeout_seconds': self.timeout,
+                'queue_timeout_seconds': self.queue_timeout,
+                'queue_depth': self.queued,
+                'in_flight': self.running,
+                'abandoned': self.abandoned,
+                'completed': self.completed,
+                'failed': self.failed,
+                'timed_out': self.timed_out,
+                'rejected': self.rejected,
+                'expired': self.expired,
+            }
+
+        def summarize(values: List[float]) -> Dict[str, Any]:
+            def percentile(p: float) -> float:
+                if not values:
+                    return 0.0
+                index = min(len(values) - 1, int(round(p * (len(values) - 1))))
+                return values[index] * 1000
+
+            return {
+                'samples': len(values),
+                'mean': (sum(values) / len(values) * 1000) if values else 0.0,
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'p99': percentile(0.99),
+                'max': (values[-1] * 1000) if values else 0.0,
+            }
+
+        for key, values in windows.items():
+            snapshot[key] = summarize(values)
+        return snapshot
+
+
+class AdmissionController:
+    # Functions that make SymPy leave the rational-function fast paths
+    NON_RATIONAL = (sp.exp, sp.log, sp.sin, sp.cos, sp.tan, sp.sinh, sp.cosh, sp.tanh)
+
+    # Inputs beyond these limits are flagged heavy and always sent to the slow lane
+    MAX_SCORED_LENGTH = 2000
+    MAX_EXPONENT = 64
+    HEAVY_WEIGHT = 100
+
+    def __init__(self, fast_lane: Lane, slow_lane: Lane, slow_score: float = 60.0,
+                 slow_seconds: float = 0.5, history_size: int = 1024,
+                 history_weight: float = 0.3):
+        self.fast_lane = fast_lane
+        self.slow_lane = slow_lane
+        self.slow_score = slow_score
+        self.slow_seconds = slow_seconds
+        self.history_size = history_size
+        self.history_weight = history_weight
+
+        # Exponentially weighted execution time per (operation, shape), LRU-bounded
+        self._history = OrderedDict()
+
+    def estimate_cost(self, expressions: List[str]) -> Dict[str, Any]:
+        """Score expressions by tree size, degree, non-rational functions, and large powers."""
+        nodes = 0
+        degree = 0
+        functions = set()
+        non_rational = 0
+        large_powers = 0
+        oversized = 0
+        unscorable = 0
+
+        for expr_str in expressions:
+            if len(expr_str) > self.MAX_SCORED_LENGTH:
+                # Too long to parse on the event loop; treat it as heavy outright
+                oversized += 1
+                functions.add('Oversized')
+                continue
+
+            try:
+                # Parsing without evaluation keeps towers like 9**9**7 symbolic and cheap
+                expr = math_engine.safe_parse_expression(expr_str, evaluate=False)
+            except ValueError:
+                # The evaluating parse may still succeed (or hang), so only a killable lane is safe
+                unscorable += 1
+                functions.add('Unscorable')
+                continue
+
+            for node in sp.preorder_traversal(expr):
+                nodes += 1
+                if isinstance(node, self.NON_RATIONAL):
+                    non_rational += 1
+                    functions.add(type(node).__name__)
+                elif node.is_Pow and node.exp.free_symbols:
+                    # Symbolic exponents such as 2**t behave like exp
+                    non_rational += 1
+                    functions.add('Pow')
+                elif node.is_Pow and self._is_large_power(node):
+                    large_powers += 1
+                    functions.add('LargePow')
+
+            degree = max(degree, self._polynomial_degree(expr))
+
+        heavy = large_powers + oversized + unscorable
+        score = nodes + 5 * degree + 20 * non_rational + self.HEAVY_WEIGHT * heavy
+        shape = (tuple(sorted(functions)), degree, nodes.bit_length())
+
+        return {
+            'nodes': nodes,
+            'degree': degree,
+            'non_rational': non_rational,
+            'large_powers': large_powers,
+            'oversized': oversized,
+            'unscorable': unscorable,
+            'heavy': heavy > 0,
+            'score': score,
+            'shape': shape,
+        }
+
+    def _is_large_power(self, node: sp.Pow) -> bool:
+        """Whether evaluating a numeric power would produce a very large number."""
+        exp = node.exp
+        if exp.is_Integer:
+            return abs(int(exp)) > self.MAX_EXPONENT
+        if not exp.is_number:
+            return False
+        # Nested numeric powers such as 9**(9**7) grow as towers
+        return any(
+            sub.is_Pow and not (sub.exp.is_Integer and abs(int(sub.exp)) <= 1)
+            for sub in sp.preorder_traversal(exp)
+        )
+
+    def _polynomial_degree(self, expr: sp.Expr) -> int:
+        """Combined degree of numerator and denominator, computed without expanding."""
+        if expr.is_Symbol:
+            return 1
+        if expr.is_Add:
+            return max(self._polynomial_degree(arg) for arg in expr.args)
+        if expr.is_Mul:
+            return sum(self._polynomial_degree(arg) for arg in expr.args)
+        if expr.is_Pow and expr.exp.is_Integer:
+            return abs(int(expr.exp)) * self._polynomial_degree(expr.base)
+        # Non-rational nodes are scored separately
+        return 0
+
+    def choose_lane(self, operation: str, cost: Dict[str, Any]) -> Lane:
+        """Pick a lane from the static score; observed timings can only promote to slow."""
+        if cost['heavy'] or cost['score'] >= self.slow_score:
+            return self.slow_lane
+        if self.fast_lane.is_stalled():
+            # Every fast worker is held by a timed-out job, so only the slow lane can make progress
+            return self.slow_lane
+
+        # Shapes are coarse, so a fast run must never vouch for other inputs of the same shape
+        observed = self._history.get((operation, cost['shape']))
+        if observed is not None and observed >= self.slow_seconds:
+            return self.slow_lane
+        return self.fast_lane
+
+    def _record(self, key: Tuple[Any, ...], seconds: float) -> None:
+        previous = self._history.pop(key, None)
+        if previous is not None:
+            seconds = (1 - self.history_weight) * previous + self.history_weight * seconds
+        self._history[key] = seconds
+        while len(self._history) > self.history_size:
+            self._history.popitem(last=False)
+
+    async def run(self, operation: str, expressions: List[str],
+                  func: Callable[..., Any], *args: Any) -> Any:
+        """Score the expressions, then run func(*args) in the selected lane."""
+        cost = self.estimate_cost(expressions)
+        lane = self.choose_lane(operation, cost)
+        key = (operation, cost['shape'])
+
+        try:
+            result, elapsed = await lane.submit(func, *args)
+        except AdmissionTimeout as e:
+            # Execution time until the timeout is a lower bound on the real cost
+            self._record(key, e.elapsed)
+            raise
+
+        self._record(key, elapsed)
+        return result
+
+    def warm_up(self) -> None:
+        """Prepare both lanes before the first request arrives."""
+        self.fast_lane.warm_up()
+        self.slow_lane.warm_up()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return per-lane statistics and routing thresholds."""
+        return {
+            'slow_score': self.slow_score,
+            'slow_seconds': self.slow_seconds,
+            'tracked_shapes': len(self._history),
+            'lanes': [self.fast_lane.stats(), self.slow_lane.stats()],
+        }
+
+
+# Create a singleton instance
+admission = AdmissionController(
+    fast_lane=Lane('fast', max_concurrency=8, timeout=5.0, max_queue=32, queue_timeout=10.0),
+    slow_lane=Lane('slow', max_concurrency=2, timeout=30.0, max_queue=8, queue_timeout=30.0,
+                   isolated=True),
+)
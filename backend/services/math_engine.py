@@ -28,7 +28,7 @@ class MathEngine:
             'e': sp.E
         }
 
-    def safe_parse_expression(self, expr_str: str) -> sp.Expr:
+    def safe_parse_expression(self, expr_str: str, evaluate: bool = True) -> sp.Expr:
         """Safely parse a mathematical expression string into a SymPy object."""
         try:
             # Replace common function names
@@ -37,7 +37,7 @@ class MathEngine:
             expr_str = expr_str.replace('delta(t)', 'DiracDelta(t)')
 
             # Parse the expression
-            expr = sp.parse_expr(expr_str, local_dict=self.local_dict)
+            expr = sp.parse_expr(expr_str, local_dict=self.local_dict, evaluate=evaluate)
             return expr
         except Exception as e:
             raise ValueError(f"Invalid expression: {expr_str}. Error: {str(e)}")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Modules import each other as top-level packages (services, models, api), as main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
\ No newline at end of file
@@ -0,0 +1,253 @@
+import asyncio
+import time
+
+import pytest
+
+from services.admission import AdmissionController, AdmissionRejected, AdmissionTimeout, Lane
+
+
+def make_controller(**kwargs):
+    return AdmissionController(
+        fast_lane=Lane('fast', max_concurrency=2, timeout=5.0),
+        slow_lane=Lane('slow', max_concurrency=1, timeout=5.0),
+        **kwargs
+    )
+
+
+def route(controller, expression, operation='laplace'):
+    return controller.choose_lane(operation, controller.estimate_cost([expression])).name
+
+
+def outcome(lane, func, *args):
+    async def wrapped():
+        try:
+            await lane.submit(func, *args)
+            return 'ok'
+        except AdmissionRejected:
+            return 'rejected'
+        except AdmissionTimeout:
+            return 'timeout'
+    return wrapped()
+
+
+# Cost estimation and routing
+
+def test_simple_rational_routes_fast():
+    controller = make_controller()
+    cost = controller.estimate_cost(['1/(s+2)'])
+
+    assert cost['degree'] == 1
+    assert not cost['heavy']
+    assert route(controller, '1/(s+2)') == 'fast'
+
+
+def test_non_rational_functions_raise_score():
+    controller = make_controller()
+    rational = controller.estimate_cost(['1/(s+2)'])
+    trig = controller.estimate_cost(['exp(-2*t)*sin(3*t)*cos(t)'])
+
+    assert trig['non_rational'] == 3
+    assert trig['score'] > rational['score']
+
+
+def test_power_tower_is_scored_without_evaluating():
+    controller = make_controller()
+    started = time.perf_counter()
+    cost = controller.estimate_cost(['9**9**9'])
+
+    assert time.perf_counter() - started < 1.0
+    assert cost['large_powers'] == 1
+    assert cost['heavy']
+    assert route(controller, '9**9**9') == 'slow'
+
+
+def test_large_integer_exponent_is_heavy():
+    controller = make_controller()
+
+    assert controller.estimate_cost(['2**100+1'])['heavy']
+    assert not controller.estimate_cost(['sqrt(s)+s**(1/2)+s**2'])['heavy']
+
+
+def test_unscorable_input_routes_slow():
+    controller = make_controller()
+    expression = '2**' * 500 + '2'
+    cost = controller.estimate_cost([expression])
+
+    assert len(expression) < controller.MAX_SCORED_LENGTH
+    assert cost['unscorable'] == 1
+    assert route(controller, expression) == 'slow'
+
+
+def test_oversized_input_routes_slow():
+    controller = make_controller()
+    expression = '+'.join(['s'] * controller.MAX_SCORED_LENGTH)
+
+    assert controller.estimate_cost([expression])['oversized'] == 1
+    assert route(controller, expression) == 'slow'
+
+
+def test_history_cannot_demote_heavy_inputs():
+    controller = make_controller()
+    cheap = controller.estimate_cost(['2**100+1'])
+    tower = controller.estimate_cost(['9**9**9'])
+    assert cheap['shape'] == tower['shape']
+
+    controller._record(('laplace', cheap['shape']), 0.05)
+    oversized = controller.estimate_cost(['s' * (controller.MAX_SCORED_LENGTH + 1)])
+    controller._record(('laplace', oversized['shape']), 0.05)
+
+    assert controller.choose_lane('laplace', tower).name == 'slow'
+    assert controller.choose_lane('laplace', oversized).name == 'slow'
+
+
+def test_history_cannot_demote_high_score():
+    controller = make_controller(slow_score=20)
+    cost = controller.estimate_cost(['exp(-2*t)*Heaviside(t)'])
+    controller._record(('laplace', cost['shape']), 0.01)
+
+    assert controller.choose_lane('laplace', cost).name == 'slow'
+
+
+def test_history_promotes_slow_shapes_per_operation():
+    controller = make_controller()
+    cost = controller.estimate_cost(['1/(s+2)'])
+    controller._record(('laplace', cost['shape']), 2.0)
+
+    assert controller.choose_lane('laplace', cost).name == 'slow'
+    assert controller.choose_lane('lti', cost).name == 'fast'
+
+
+def test_stalled_fast_lane_routes_slow():
+    controller = make_controller()
+    controller.fast_lane.abandoned = controller.fast_lane.max_concurrency
+
+    assert route(controller, '1/(s+2)') == 'slow'
+
+
+# Lane bookkeeping
+
+def test_submit_returns_result_and_run_time():
+    lane = Lane('test', max_concurrency=1, timeout=1.0)
+    result, elapsed = asyncio.run(lane.submit(sum, [1, 2, 3]))
+    stats = lane.stats()
+
+    assert result == 6
+    assert elapsed >= 0
+    assert stats['completed'] == 1
+    assert stats['queue_depth'] == stats['in_flight'] == 0
+    assert stats['wait_ms']['samples'] == stats['run_ms']['samples'] == 1
+
+
+def test_timeout_excludes_queue_wait():
+    lane = Lane('test', max_concurrency=1, timeout=0.5)
+
+    async def main():
+        return await asyncio.gather(*[outcome(lane, time.sleep, 0.3) for _ in range(4)])
+
+    assert asyncio.run(main()) == ['ok'] * 4
+    assert lane.stats()['timed_out'] == 0
+    assert lane.stats()['completed'] == 4
+
+
+def test_full_queue_is_rejected():
+    lane = Lane('test', max_concurrency=1, timeout=1.0, max_queue=1)
+
+    async def main():
+        running = asyncio.ensure_future(outcome(lane, time.sleep, 0.2))
+        await asyncio.sleep(0.05)
+        queued = asyncio.ensure_future(outcome(lane, time.sleep, 0))
+        await asyncio.sleep(0.01)
+        rejected = await outcome(lane, time.sleep, 0)
+        return [await running, await queued, rejected]
+
+    assert asyncio.run(main()) == ['ok', 'ok', 'rejected']
+    stats = lane.stats()
+    assert stats['rejected'] == 1
+    assert stats['queue_depth'] == stats['in_flight'] == 0
+
+
+def test_expired_queue_wait_is_rejected_and_dequeued():
+    lane = Lane('test', max_concurrency=1, timeout=5.0, queue_timeout=0.1)
+
+    async def main():
+        return await asyncio.gather(outcome(lane, time.sleep, 0.4), outcome(lane, time.sleep, 0))
+
+    assert asyncio.run(main()) == ['ok', 'rejected']
+    stats = lane.stats()
+    assert stats['expired'] == 1
+    assert stats['completed'] == 1
+    assert stats['queue_depth'] == stats['in_flight'] == 0
+
+
+def test_timed_out_thread_is_abandoned_until_it_returns():
+    lane = Lane('test', max_concurrency=1, timeout=0.1)
+
+    with pytest.raises(AdmissionTimeout) as error:
+        asyncio.run(lane.submit(time.sleep, 0.5))
+
+    assert 0.1 <= error.value.elapsed < 0.5
+    assert lane.stats()['abandoned'] == 1
+    assert lane.stats()['in_flight'] == 1
+    assert lane.is_stalled()
+
+    time.sleep(0.6)
+    assert lane.stats()['abandoned'] == 0
+    assert lane.stats()['in_flight'] == 0
+    assert not lane.is_stalled()
+
+
+def test_failure_is_counted_and_raised():
+    lane = Lane('test', max_concurrency=1, timeout=1.0)
+
+    with pytest.raises(ValueError):
+        asyncio.run(lane.submit(int, 'x'))
+    assert lane.stats()['failed'] == 1
+
+
+def test_isolated_lane_kills_overrunning_job():
+    lane = Lane('test', max_concurrency=1, timeout=0.5, isolated=True)
+    lane.warm_up()
+
+    started = time.perf_counter()
+    with pytest.raises(AdmissionTimeout):
+        asyncio.run(lane.submit(time.sleep, 30))
+
+    assert time.perf_counter() - started < 5.0
+    stats = lane.stats()
+    assert stats['timed_out'] == 1
+    assert stats['in_flight'] == stats['abandoned'] == 0
+
+
+def test_isolated_lane_returns_results_and_errors():
+    lane = Lane('test', max_concurrency=1, timeout=5.0, isolated=True)
+    lane.warm_up()
+
+    assert asyncio.run(lane.submit(sum, [1, 2, 3]))[0] == 6
+    with pytest.raises(ValueError):
+        asyncio.run(lane.submit(int, 'x'))
+    assert lane.stats()['completed'] == 1
+    assert lane.stats()['failed'] == 1
+
+
+# Controller history
+
+def test_timeout_records_execution_time_only():
+    controller = AdmissionController(
+        fast_lane=Lane('fast', max_concurrency=1, timeout=0.2, queue_timeout=0.1),
+        slow_lane=Lane('slow', max_concurrency=1, timeout=5.0),
+    )
+    running_key = ('laplace', controller.estimate_cost(['1/(s+2)'])['shape'])
+    queued_key = ('laplace', controller.estimate_cost(['s/(s**2+1)'])['shape'])
+
+    async def attempt(expression, seconds):
+        try:
+            await controller.run('laplace', [expression], time.sleep, seconds)
+        except (AdmissionRejected, AdmissionTimeout) as e:
+            return type(e)
+
+    async def main():
+        return await asyncio.gather(attempt('1/(s+2)', 0.5), attempt('s/(s**2+1)', 0))
+
+    assert asyncio.run(main()) == [AdmissionTimeout, AdmissionRejected]
+    assert 0.2 <= controller._history[running_key] < 0.5
+    assert queued_key not in controller._history